@@ -10,7 +10,6 @@ import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
 from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
 # Paths
 ML_DIR = os.path.dirname(os.path.abspath(__file__))
@@ -19,6 +18,53 @@ EMBEDDINGS_PATH = os.path.join(ML_DIR, 'embeddings.pkl')
 CLASSIFIER_PATH = os.path.join(ML_DIR, 'classifier.pkl')
 LABELS_PATH = os.path.join(ML_DIR, 'labels.json')
 ENTITIES_PATH = os.path.join(ML_DIR, 'entities.json')
+ARTICLES_CACHE_PATH = os.path.join(ML_DIR, 'articles_cache.pkl')
+
+
+def load_articles(articles_path):
+    """
+    Load articles.csv as a DataFrame.
+    
+    The parsed frame is pickled next to the models and reused while the
+    CSV's mtime and size are unchanged, so restarts skip CSV parsing.
+    """
+    stat = os.stat(articles_path)
+    cache_key = (os.path.abspath(articles_path), stat.st_mtime_ns, stat.st_size)
+    
+    if os.path.exists(ARTICLES_CACHE_PATH):
+        try:
+            with open(ARTICLES_CACHE_PATH, 'rb') as f:
+                cached = pickle.load(f)
+            if cached.get('key') == cache_key:
+                return cached['articles']
+        except Exception as e:
+            print(f"Ignoring unreadable articles cache: {e}")
+    
+    # source has a dozen distinct values - store it as a category
+    articles = pd.read_csv(articles_path, dtype={'source': 'category'})
+    articles['date'] = pd.to_datetime(articles['date'], errors='coerce')
+    
+    # Write to a temp file first so concurrent workers never read half a cache
+    try:
+        tmp_path = f"{ARTICLES_CACHE_PATH}.{os.getpid()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            pickle.dump({'key': cache_key, 'articles': articles}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, ARTICLES_CACHE_PATH)
+    except OSError as e:
+        print(f"Could not write articles cache: {e}")
+    
+    return articles
+
+
+def normalize_rows(embeddings):
+    """L2-normalize embeddings once, as float32, so cosine similarity is a dot product.
+    All-zero rows (articles without an embedding) are left as zeros."""
+    embeddings = np.asarray(embeddings, dtype=np.float32)
+    if embeddings.ndim != 2 or len(embeddings) == 0:
+        return embeddings
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return embeddings / norms
 
 
 class OilGasChatbot:
@@ -44,8 +90,7 @@ class OilGasChatbot:
         # Load articles
         articles_path = os.path.join(DATA_DIR, 'articles.csv')
         if os.path.exists(articles_path):
-            self.articles = pd.read_csv(articles_path)
-            self.articles['date'] = pd.to_datetime(self.articles['date'], errors='coerce')
+            self.articles = load_articles(articles_path)
         else:
             self.articles = pd.DataFrame(columns=['title', 'content', 'date', 'source', 'link'])
         
@@ -53,7 +98,7 @@ class OilGasChatbot:
         if os.path.exists(EMBEDDINGS_PATH):
             with open(EMBEDDINGS_PATH, 'rb') as f:
                 data = pickle.load(f)
-                self.embeddings = data.get('embeddings', np.array([]))
+                self.embeddings = normalize_rows(data.get('embeddings', np.array([])))
                 print(f"Loaded {len(self.embeddings)} embeddings")
         else:
             self.embeddings = np.array([])
@@ -80,8 +125,8 @@ class OilGasChatbot:
         self.loaded = True
         print("Models loaded successfully!")
     
-    def search_articles(self, query, top_k=5):
-        """Search articles using semantic similarity"""
+    def search_articles(self, query, top_k=5, query_embedding=None):
+        """Search articles using semantic similarity (pass query_embedding to reuse an encoding)"""
         if not self.loaded:
             self.load_models()
         
@@ -89,10 +134,11 @@ class OilGasChatbot:
             return []
         
         # Encode query
-        query_embedding = self.model.encode([query])[0]
+        if query_embedding is None:
+            query_embedding = self.model.encode([query])[0]
         
-        # Calculate similarities
-        similarities = cosine_similarity([query_embedding], self.embeddings)[0]
+        # Calculate similarities (article embeddings are normalized at load)
+        similarities = self.embeddings @ normalize_rows([query_embedding])[0]
         
         # Extract key terms from query for keyword matching
         query_lower = query.lower()
@@ -112,8 +158,10 @@ class OilGasChatbot:
         if 'opec' in query_lower:
             required_terms.extend(['opec', 'opec+'])
         
-        # Get top results
-        top_indices = np.argsort(similarities)[::-1][:top_k * 5]  # Get more candidates
+        # Get top results - partition out the candidates, then sort only those
+        num_candidates = min(top_k * 5, len(similarities))  # Get more candidates
+        top_indices = np.argpartition(-similarities, num_candidates - 1)[:num_candidates]
+        top_indices = top_indices[np.argsort(-similarities[top_indices])]
         
         results = []
         now = datetime.now()
@@ -204,14 +252,15 @@ class OilGasChatbot:
         results.sort(key=lambda x: x['score'], reverse=True)
         return results[:top_k]
     
-    def classify_query(self, query):
-        """Classify query into category"""
+    def classify_query(self, query, query_embedding=None):
+        """Classify query into category (pass query_embedding to reuse an encoding)"""
         if not self.classifier:
             return {'category': 'general', 'confidence': 0.5}
         
         try:
-            query_embedding = self.model.encode([query])
-            proba = self.classifier.predict_proba(query_embedding)[0]
+            if query_embedding is None:
+                query_embedding = self.model.encode([query])[0]
+            proba = self.classifier.predict_proba([query_embedding])[0]
             pred_idx = np.argmax(proba)
             confidence = float(proba[pred_idx])
             
@@ -210,7 +210,6 @@ def scrape(existing_links=None):
     results = fetch_articles_parallel(
         articles=new_articles,
         fetch_func=get_article_content,
-        max_workers=10,
         source_name=SOURCE,
         standardize=True
     )
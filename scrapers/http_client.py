@@ -0,0 +1,93 @@
+"""
+Shared HTTP Client for Oil & Gas Scrapers
+==========================================
+A single pooled requests.Session used by all scrapers, so keep-alive
+connections, TLS sessions and DNS lookups are reused across requests and
+across sources when main.py runs scrapers side by side.
+
+Note: named http_client (not http) because main.py puts the scrapers
+folder on sys.path, where a module called http would shadow the stdlib.
+"""
+
+import threading
+import time
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+from urllib3.util.request import ACCEPT_ENCODING
+
+# Connection pool sizing - one pool per host, each large enough for the
+# parallel article fetcher in scrapers.utils
+POOL_CONNECTIONS = 20
+POOL_MAXSIZE = 20
+
+# Retry connection errors and throttling/server errors with exponential
+# backoff (0.5s, 1s, 2s). When retries run out the last response is returned,
+# so scrapers still see and log the status code. Retry-After is ignored: the
+# retry sleeps while holding the per-host lock/semaphore, and a server could
+# ask for hours.
+RETRIES = Retry(
+    total=3,
+    backoff_factor=0.5,
+    status_forcelist=[429, 500, 502, 503, 504],
+    respect_retry_after_header=False,
+    raise_on_status=False,
+)
+
+# Minimum seconds between polite_get() requests to the same host
+MIN_INTERVAL = {
+    'www.offshore-energy.biz': 1.0,
+    'www.worldoil.com': 1.0,
+}
+
+SESSION = requests.Session()
+
+# Advertise every encoding urllib3 can decode: gzip/deflate always, plus br
+# (and zstd) when brotli is installed. Responses are decoded transparently.
+SESSION.headers['Accept-Encoding'] = ACCEPT_ENCODING
+
+_adapter = HTTPAdapter(
+    pool_connections=POOL_CONNECTIONS,
+    pool_maxsize=POOL_MAXSIZE,
+    max_retries=RETRIES,
+)
+SESSION.mount('https://', _adapter)
+SESSION.mount('http://', _adapter)
+
+# Completion time of the last polite_get() per host, and one lock per host
+# so a waiting scraper never blocks requests to other hosts
+_last_request = {}
+_host_locks = {}
+_host_locks_guard = threading.Lock()
+
+
+def _host_lock(host):
+    with _host_locks_guard:
+        if host not in _host_locks:
+            _host_locks[host] = threading.Lock()
+        return _host_locks[host]
+
+
+def polite_get(url, **kwargs):
+    """
+    GET through the shared session, rate limited per host.
+    
+    Only sleeps for whatever is left of the host's MIN_INTERVAL since its
+    last request completed, so slow responses cost no extra delay.
+    """
+    host = urlparse(url).netloc
+    interval = MIN_INTERVAL.get(host, 0)
+    if interval:
+        with _host_lock(host):
+            last = _last_request.get(host)
+            if last is not None:
+                wait = interval - (time.monotonic() - last)
+                if wait > 0:
+                    time.sleep(wait)
+            try:
+                return SESSION.get(url, **kwargs)
+            finally:
+                _last_request[host] = time.monotonic()
+    return SESSION.get(url, **kwargs)
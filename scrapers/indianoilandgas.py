@@ -20,11 +20,10 @@ Logic:
 """
 
 from bs4 import BeautifulSoup
-import requests
-import pandas as pd
 import os
 import re
 from datetime import datetime, timedelta
+from scrapers.http_client import SESSION
 from scrapers.utils import standardize_date, clean_content, save_to_csv, get_existing_links as get_links, fetch_articles_parallel
 
 SOURCE = 'indianoilandgas'
@@ -124,8 +123,8 @@ def get_article_links(soup):
 def get_article_content(url):
     """Scrape article content from article page"""
     try:
-        response = requests.get(url, headers=headers, timeout=TIMEOUT)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = SESSION.get(url, headers=headers, timeout=TIMEOUT)
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Find the main article content - look for td with article text
         tds = soup.find_all('td')
@@ -164,22 +163,16 @@ def scrape(existing_links=None):
     if existing_links is None:
         existing_links = get_existing_links()
     
-    # Count indianoilandgas articles specifically
-    iog_count = 0
-    if os.path.exists(CSV_FILE):
-        df = pd.read_csv(CSV_FILE)
-        iog_count = len(df[df['source'] == SOURCE])
-    
-    print(f"Already scraped from Indian Oil & Gas: {iog_count} articles")
+    print(f"Already scraped from Indian Oil & Gas: {len(existing_links)} articles")
     
     try:
-        response = requests.get(NEWS_URL, headers=headers, timeout=TIMEOUT)
+        response = SESSION.get(NEWS_URL, headers=headers, timeout=TIMEOUT)
         print(f"Status: {response.status_code}")
     except Exception as e:
         print(f"Error fetching main page: {e}")
         return []
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml')
     
     print("\nChecking articles...")
     recent_articles = get_article_links(soup)
@@ -198,7 +191,6 @@ def scrape(existing_links=None):
     results = fetch_articles_parallel(
         articles=new_articles,
         fetch_func=get_article_content,
-        max_workers=10,
         source_name=SOURCE,
         standardize=True
     )
@@ -17,10 +17,10 @@ Logic:
 """
 
 from bs4 import BeautifulSoup
-import requests
-import pandas as pd
 import os
+import re
 from datetime import datetime, timedelta
+from scrapers.http_client import SESSION
 from scrapers.utils import standardize_date, clean_content, save_to_csv, get_existing_links as get_links, fetch_articles_parallel
 
 SOURCE = 'oilandgaswatch'
@@ -29,6 +29,9 @@ NEWS_URL = 'https://news.oilandgaswatch.org/articles'
 CSV_FILE = os.path.join(os.path.dirname(__file__), 'articles.csv')
 TIMEOUT = 30  # seconds
 
+# A date div contains a month name, e.g. "December 18, 2025"
+MONTH_PATTERN = re.compile(r'January|February|March|April|May|June|July|August|September|October|November|December')
+
 headers = {
     'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
     'accept-language': 'en-US,en;q=0.9',
@@ -55,6 +58,13 @@ def is_recent(date_text):
     return True
 
 
+def _is_date_div(tag):
+    """Match <div class="text-small"> elements whose text looks like a date"""
+    return (tag.name == 'div'
+            and 'text-small' in tag.get('class', [])
+            and MONTH_PATTERN.search(tag.get_text()) is not None)
+
+
 def get_article_links(soup):
     """Extract article links from the main page - only for recent articles"""
     articles = []
@@ -74,19 +84,13 @@ def get_article_links(soup):
         parent = button.parent
         date_text = None
         
-        # Search up to 5 levels up for the date
+        # Search up to 5 levels up, stopping at the first date div found
         for _ in range(5):
             if parent is None:
                 break
-            date_divs = parent.find_all('div', class_='text-small')
-            for div in date_divs:
-                text = div.get_text().strip()
-                # Check if it looks like a date (contains month name)
-                if any(month in text for month in ['January', 'February', 'March', 'April', 'May', 'June', 
-                                                     'July', 'August', 'September', 'October', 'November', 'December']):
-                    date_text = text
-                    break
-            if date_text:
+            date_div = parent.find(_is_date_div)
+            if date_div:
+                date_text = date_div.get_text().strip()
                 break
             parent = parent.parent
         
@@ -106,8 +110,8 @@ def get_article_links(soup):
 def get_article_content(url):
     """Scrape article content from article page"""
     try:
-        response = requests.get(url, headers=headers, timeout=TIMEOUT)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = SESSION.get(url, headers=headers, timeout=TIMEOUT)
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Get all paragraphs
         paragraphs = soup.find_all('p')
@@ -136,22 +140,16 @@ def scrape(existing_links=None):
     if existing_links is None:
         existing_links = get_existing_links()
     
-    # Count oilandgaswatch articles specifically
-    ogw_count = 0
-    if os.path.exists(CSV_FILE):
-        df = pd.read_csv(CSV_FILE)
-        ogw_count = len(df[df['source'] == SOURCE])
-    
-    print(f"Already scraped from Oil & Gas Watch: {ogw_count} articles")
+    print(f"Already scraped from Oil & Gas Watch: {len(existing_links)} articles")
     
     try:
-        response = requests.get(NEWS_URL, headers=headers, timeout=TIMEOUT)
+        response = SESSION.get(NEWS_URL, headers=headers, timeout=TIMEOUT)
         print(f"Status: {response.status_code}")
     except Exception as e:
         print(f"Error fetching main page: {e}")
         return []
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(response.content, 'lxml')
     
     print("\nChecking articles...")
     recent_articles = get_article_links(soup)
@@ -170,7 +168,6 @@ def scrape(existing_links=None):
     results = fetch_articles_parallel(
         articles=new_articles,
         fetch_func=get_article_content,
-        max_workers=10,
         source_name=SOURCE,
         standardize=True
     )
@@ -20,12 +20,12 @@ Logic:
 """
 
 from bs4 import BeautifulSoup
-import requests
-import pandas as pd
 import os
 import json
 import html
+import re
 from datetime import datetime, timedelta
+from scrapers.http_client import SESSION, polite_get
 from scrapers.utils import standardize_date, clean_content, save_to_csv, get_existing_links as get_links, fetch_articles_parallel
 
 SOURCE = 'offshore-energy'
@@ -40,6 +40,15 @@ NEWS_URLS = [
 CSV_FILE = os.path.join(os.path.dirname(__file__), 'articles.csv')
 TIMEOUT = 30  # seconds
 
+# Fast path for data-config: the teaser JSON is a flat object starting with url,
+# then title and release_date, so read the three strings without building a dict
+TEASER_CONFIG_PATTERN = re.compile(
+    r'\s*\{\s*"url"\s*:\s*"((?:[^"\\]|\\.)*)"'
+    r'.*?"title"\s*:\s*"((?:[^"\\]|\\.)*)"'
+    r'.*?"release_date"\s*:\s*"((?:[^"\\]|\\.)*)"',
+    re.DOTALL
+)
+
 headers = {
     'accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
     'accept-language': 'en-US,en;q=0.9',
@@ -74,6 +83,23 @@ def format_date(date_str):
     return date_str
 
 
+def json_string(value):
+    """Decode JSON escapes (e.g. \\/ or \\u2019) in a raw string value"""
+    return json.loads(f'"{value}"') if '\\' in value else value
+
+
+def parse_teaser_config(config_str):
+    """Return (url, title, release_date) from a data-config JSON string"""
+    match = TEASER_CONFIG_PATTERN.match(config_str)
+    # A nested object before the matched keys could supply its own "title"
+    if match and config_str.count('{', 0, match.end()) == 1:
+        return tuple(json_string(value) for value in match.groups())
+    
+    # Unexpected key order, missing keys or nested objects - parse the full JSON
+    config = json.loads(config_str)
+    return config.get('url', ''), config.get('title', ''), config.get('release_date', '')
+
+
 def get_article_links(soup):
     """Extract article links from data-teaser divs"""
     articles = []
@@ -84,16 +110,13 @@ def get_article_links(soup):
     for teaser in teasers:
         config_str = teaser.get('data-config', '{}')
         try:
-            config = json.loads(config_str)
+            url, title, release_date = parse_teaser_config(config_str)
         except:
             continue
         
-        url = config.get('url', '')
-        title = config.get('title', '')
-        release_date = config.get('release_date', '')
-        
         # Decode HTML entities in title
-        title = html.unescape(title)
+        if '&' in title:
+            title = html.unescape(title)
         
         if not url or not release_date:
             continue
@@ -112,8 +135,8 @@ def get_article_links(soup):
 def get_article_content(url):
     """Scrape article content from article page"""
     try:
-        response = requests.get(url, headers=headers, timeout=TIMEOUT)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = SESSION.get(url, headers=headers, timeout=TIMEOUT)
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Find paragraphs - skip the "Share this article" and promotional content
         paragraphs = soup.find_all('p')
@@ -155,46 +178,38 @@ def scrape(existing_links=None):
     3. Scrape content
     4. Save to CSV
     """
-    import time
     if existing_links is None:
         existing_links = get_existing_links()
     
-    # Count offshore-energy articles specifically
-    oe_count = 0
-    if os.path.exists(CSV_FILE):
-        df = pd.read_csv(CSV_FILE)
-        oe_count = len(df[df['source'] == SOURCE])
-    
-    print(f"Already scraped from Offshore Energy: {oe_count} articles")
+    print(f"Already scraped from Offshore Energy: {len(existing_links)} articles")
     
     all_articles = []
     
     for news_url in NEWS_URLS:
         print(f"\n--- Checking {news_url} ---")
         try:
-            response = requests.get(news_url, headers=headers, timeout=TIMEOUT)
+            response = polite_get(news_url, headers=headers, timeout=TIMEOUT)
             print(f"Status: {response.status_code}")
         except Exception as e:
             print(f"Error fetching page: {e}")
             continue
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         articles = get_article_links(soup)
         all_articles.extend(articles)
-        time.sleep(1)  # Be nice to the server
     
-    # Remove duplicates
+    # Remove duplicates and already scraped links in one pass
     seen = set()
-    unique_articles = []
+    new_articles = []
     for article in all_articles:
-        if article['link'] not in seen:
-            seen.add(article['link'])
-            unique_articles.append(article)
-    
-    print(f"\nFound {len(unique_articles)} total articles")
+        link = article['link']
+        if link in seen:
+            continue
+        seen.add(link)
+        if link not in existing_links:
+            new_articles.append(article)
     
-    # Filter out already scraped
-    new_articles = [a for a in unique_articles if a['link'] not in existing_links]
+    print(f"\nFound {len(seen)} total articles")
     print(f"New articles to scrape: {len(new_articles)}")
     
     if not new_articles:
@@ -205,7 +220,6 @@ def scrape(existing_links=None):
     results = fetch_articles_parallel(
         articles=new_articles,
         fetch_func=get_article_content,
-        max_workers=10,
         source_name=SOURCE,
         standardize=True
     )
@@ -25,10 +25,9 @@ Logic:
 """
 
 from bs4 import BeautifulSoup
-import requests
-import pandas as pd
 import os
 from datetime import datetime, timedelta
+from scrapers.http_client import SESSION
 from scrapers.utils import standardize_date, clean_content, save_to_csv, get_existing_links as get_links, fetch_articles_parallel
 
 SOURCE = 'ogj'
@@ -125,8 +124,8 @@ def get_article_links(soup, url):
 def get_article_content(url):
     """Scrape article content from article page"""
     try:
-        response = requests.get(url, headers=headers, timeout=TIMEOUT)
-        soup = BeautifulSoup(response.content, 'html.parser')
+        response = SESSION.get(url, headers=headers, timeout=TIMEOUT)
+        soup = BeautifulSoup(response.content, 'lxml')
         
         # Find article body
         article_body = soup.find('div', class_='article-body') or soup.find('article')
@@ -163,13 +162,7 @@ def scrape(existing_links=None):
     if existing_links is None:
         existing_links = get_existing_links()
     
-    # Count OGJ articles specifically
-    ogj_count = 0
-    if os.path.exists(CSV_FILE):
-        df = pd.read_csv(CSV_FILE)
-        ogj_count = len(df[df['source'] == SOURCE])
-    
-    print(f"Already scraped from OGJ: {ogj_count} articles")
+    print(f"Already scraped from OGJ: {len(existing_links)} articles")
     
     all_recent_articles = []
     
@@ -177,28 +170,28 @@ def scrape(existing_links=None):
         print(f"\n--- Checking {news_url} ---")
         
         try:
-            response = requests.get(news_url, headers=headers, timeout=TIMEOUT)
+            response = SESSION.get(news_url, headers=headers, timeout=TIMEOUT)
             print(f"Status: {response.status_code}")
         except Exception as e:
             print(f"Error fetching {news_url}: {e}")
             continue
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        soup = BeautifulSoup(response.content, 'lxml')
         recent_articles = get_article_links(soup, news_url)
         all_recent_articles.extend(recent_articles)
     
-    # Remove duplicates
+    # Remove duplicates and already scraped links in one pass
     seen = set()
-    unique_articles = []
+    new_articles = []
     for article in all_recent_articles:
-        if article['link'] not in seen:
-            seen.add(article['link'])
-            unique_articles.append(article)
-    
-    print(f"\nFound {len(unique_articles)} total articles")
+        link = article['link']
+        if link in seen:
+            continue
+        seen.add(link)
+        if link not in existing_links:
+            new_articles.append(article)
     
-    # Filter out already scraped
-    new_articles = [a for a in unique_articles if a['link'] not in existing_links]
+    print(f"\nFound {len(seen)} total articles")
     print(f"New articles to scrape: {len(new_articles)}")
     
     if not new_articles:
@@ -209,7 +202,6 @@ def scrape(existing_links=None):
     results = fetch_articles_parallel(
         articles=new_articles,
         fetch_func=get_article_content,
-        max_workers=10,
         source_name=SOURCE,
         standardize=True
     )
@@ -20,21 +20,37 @@ NOTE: Reuters requires browser cookies to bypass bot protection.
 Update cookies periodically from browser DevTools.
 """
 
-from bs4 import BeautifulSoup
-import requests
+from lxml import etree, html as lxml_html
 import pandas as pd
 import os
 import re
-from datetime import datetime, timedelta
+from datetime import datetime
 from scrapers.utils import standardize_date, clean_content, save_to_csv, get_existing_links as get_links, fetch_articles_parallel
+from scrapers.http_client import SESSION
 
 SOURCE = 'reuters'
 BASE_URL = 'https://www.reuters.com'
 NEWS_URL = 'https://www.reuters.com/business/energy/'
 CSV_FILE = os.path.join(os.path.dirname(__file__), 'articles.csv')
 TIMEOUT = 30  # seconds
+CHUNK_SIZE = 64 * 1024  # bytes fed to the section page parser at a time
+
+# Section prefix every energy article href starts with
+SECTION_PATH = '/business/energy/'
+
+# Trailing date in article URLs: /business/energy/article-title-2025-12-19/
+URL_DATE_PATTERN = re.compile(r'-(\d{4})-(\d{2})-(\d{2})/?$')
+
+# Footer text stripped from article bodies
+FOOTER_PATTERNS = [
+    re.compile(r'Reporting by.*$', re.IGNORECASE),
+    re.compile(r'Sign up\s+here\.?', re.IGNORECASE),
+    re.compile(r'Our Standards:.*$', re.IGNORECASE),
+]
 
 # Browser cookies - UPDATE THESE FROM YOUR BROWSER WHEN EXPIRED
+# (passed per request, not stored on the shared session, so they are only
+# ever sent to reuters.com)
 cookies = {
     '_ga_WBSR7WLTGD': 'GS2.1.s1766238162$o1$g1$t1766238366$j41$l0$h0',
     'cleared-onetrust-cookies': 'Thu, 17 Feb 2022 19:17:07 GMT',
@@ -87,7 +103,7 @@ def get_existing_links():
 
 def extract_date_from_url(url):
     """Extract date from URL like /business/energy/article-title-2025-12-19/"""
-    match = re.search(r'-(\d{4})-(\d{2})-(\d{2})/?$', url)
+    match = URL_DATE_PATTERN.search(url)
     if match:
         year, month, day = match.groups()
         try:
@@ -99,76 +115,109 @@ def extract_date_from_url(url):
 
 def extract_date_from_time_element(container):
     """Extract date from time element with datetime attribute"""
-    time_elem = container.find('time', attrs={'data-testid': 'Text'})
-    if time_elem and time_elem.get('datetime'):
+    time_elems = container.xpath('.//time[@data-testid="Text"]')
+    datetime_attr = time_elems[0].get('datetime') if time_elems else None
+    if datetime_attr:
         try:
-            dt = datetime.fromisoformat(time_elem['datetime'].replace('Z', '+00:00'))
+            dt = datetime.fromisoformat(datetime_attr.replace('Z', '+00:00'))
             return dt.date()
         except:
             pass
     return None
 
 
-def get_article_links(soup):
-    """Extract article links from energy section page using multiple selectors"""
+def parse_section_page(response):
+    """
+    Incrementally parse a streamed section page into an lxml.html tree.
+    
+    Script/style bodies (the bulk of a Reuters page) are cleared as soon as
+    they are parsed, so they never sit in the tree alongside the markup.
+    The rest of the tree is kept - dates are looked up via ancestor cards.
+    """
+    parser = etree.HTMLPullParser(events=('end',), tag=('script', 'style'))
+    parser.set_element_class_lookup(lxml_html.HtmlElementClassLookup())
+    for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+        parser.feed(chunk)
+        for _, elem in parser.read_events():
+            elem.clear(keep_tail=True)
+    return parser.close()
+
+
+def make_article(href, title, article_date):
+    """Build the article dict for a section link"""
+    # DATE FILTERING DISABLED - Collecting all articles for NLP training
+    date_str = article_date.strftime('%B %d, %Y') if article_date else 'Unknown'
+    return {
+        'link': BASE_URL + href,
+        'date': date_str,
+        'title': title
+    }
+
+
+def get_article_links(tree):
+    """Extract article links from energy section page (lxml tree) using multiple selectors"""
     articles = []
     seen = set()
     
-    today = datetime.now().date()
-    yesterday = today - timedelta(days=1)
+    # One pass over the section links, bucketed by card type. The buckets are
+    # handled in priority order below, so a card headline always wins over
+    # another anchor (image, kicker) pointing at the same article.
+    section_links = []
+    title_links = []
+    author_cards = []
+    for link in tree.xpath('//a[starts-with(@href, $prefix)]', prefix=SECTION_PATH):
+        section_links.append(link)
+        testid = link.get('data-testid')
+        if testid == 'Title':
+            title_links.append(link)
+        elif testid == 'AuthorStoryCard':
+            author_cards.append(link)
+    
+    # Map each headline to its nearest BasicCard/HubCard in one pass over the
+    # cards. Cards come in document order, so a nested card overwrites its
+    # parent - same result as the nearest-ancestor lookup per link
+    title_cards = {}
+    for card in tree.xpath('//div[@data-testid="BasicCard" or @data-testid="HubCard"]'):
+        for link in card.xpath('.//a[@data-testid="Title"]'):
+            title_cards[link] = card
     
     # Method 1: BasicCard articles (a[data-testid="Title"])
-    title_links = soup.find_all('a', attrs={'data-testid': 'Title'})
     for link in title_links:
-        href = link.get('href', '')
-        if not href.startswith('/business/energy/'):
-            continue
+        href = link.get('href')
         if href in seen:
             continue
         
-        title = link.get_text().strip()
+        title = link.text_content().strip()
         if not title or len(title) < 10:
             continue
         
-        # Find parent container to get datetime
-        container = link.find_parent('div', attrs={'data-testid': ['BasicCard', 'HubCard']})
-        article_date = None
-        if container:
-            article_date = extract_date_from_time_element(container)
+        # Get datetime from the parent card
+        container = title_cards.get(link)
+        article_date = extract_date_from_time_element(container) if container is not None else None
         
         # Fallback to URL date extraction
         if not article_date:
             article_date = extract_date_from_url(href)
         
         seen.add(href)
-        full_url = BASE_URL + href
-        
-        # DATE FILTERING DISABLED - Collecting all articles for NLP training
-        date_str = article_date.strftime('%B %d, %Y') if article_date else 'Unknown'
-        articles.append({
-            'link': full_url,
-            'date': date_str,
-            'title': title
-        })
-        print(f"  ✓ Found ({date_str}): {title[:50]}...")
+        article = make_article(href, title, article_date)
+        articles.append(article)
+        print(f"  ✓ Found ({article['date']}): {title[:50]}...")
     
     # Method 2: AuthorStoryCard articles
-    author_cards = soup.find_all('a', attrs={'data-testid': 'AuthorStoryCard'})
     for link in author_cards:
-        href = link.get('href', '')
-        if not href.startswith('/business/energy/'):
-            continue
+        href = link.get('href')
         if href in seen:
             continue
         if '--reeii-' in href:  # Skip premium articles
             continue
         
         # Get title from nested h3/span
-        title_elem = link.find(['h3', 'span'], attrs={'data-testid': 'Heading'})
-        if title_elem:
-            title = title_elem.get_text().strip()
+        title_elems = link.xpath('(.//*[self::h3 or self::span][@data-testid="Heading"])[1]')
+        if title_elems:
+            title = title_elems[0].text_content().strip()
         else:
-            title = link.get_text().strip()
+            title = link.text_content().strip()
         
         if not title or len(title) < 10:
             continue
@@ -178,57 +227,37 @@ def get_article_links(soup):
             article_date = extract_date_from_url(href)
         
         seen.add(href)
-        full_url = BASE_URL + href
-        
-        # DATE FILTERING DISABLED - Collecting all articles for NLP training
-        date_str = article_date.strftime('%B %d, %Y') if article_date else 'Unknown'
-        articles.append({
-            'link': full_url,
-            'date': date_str,
-            'title': title
-        })
-        print(f"  ✓ Found AuthorCard ({date_str}): {title[:50]}...")
+        article = make_article(href, title, article_date)
+        articles.append(article)
+        print(f"  ✓ Found AuthorCard ({article['date']}): {title[:50]}...")
     
-    # Method 3: Fallback - scan ALL links with /business/energy/ href
-    all_links = soup.find_all('a', href=True)
-    for link in all_links:
-        href = link.get('href', '')
+    # Method 3: Fallback - any remaining /business/energy/ link
+    for link in section_links:
+        href = link.get('href')
         
-        if not href.startswith('/business/energy/'):
-            continue
-        if href.count('/') < 4:  # Need full article path
+        if href.find('/', len(SECTION_PATH)) == -1:  # Need full article path
             continue
         if '--reeii-' in href:  # Skip premium articles
             continue
         if href in seen:
             continue
         
-        title = link.get_text().strip()
+        title = link.text_content().strip()
         if not title or len(title) < 10:
             continue
         
         # Try to find date from nearest time element
-        parent = link.find_parent(['li', 'div', 'article'])
-        article_date = None
-        if parent:
-            article_date = extract_date_from_time_element(parent)
+        parents = link.xpath('ancestor::*[self::li or self::div or self::article][1]')
+        article_date = extract_date_from_time_element(parents[0]) if parents else None
         
         # Fallback to URL date extraction
         if not article_date:
             article_date = extract_date_from_url(href)
         
         seen.add(href)
-        full_url = BASE_URL + href
-        
-        # DATE FILTERING DISABLED - Collecting all articles for NLP training
-        date_str = article_date.strftime('%B %d, %Y') if article_date else 'Unknown'
-        articles.append({
-            'link': full_url,
-            'date': date_str,
-            'title': title
-        })
-        print(f"  ✓ Found Fallback ({date_str}): {title[:50]}...")
-
+        article = make_article(href, title, article_date)
+        articles.append(article)
+        print(f"  ✓ Found Fallback ({article['date']}): {title[:50]}...")
     
     return articles
 
@@ -236,27 +265,29 @@ def get_article_links(soup):
 def get_article_content(url):
     """Scrape article content from article page"""
     try:
-        response = requests.get(url, cookies=cookies, headers=headers, timeout=TIMEOUT)
+        response = SESSION.get(url, cookies=cookies, headers=headers, timeout=TIMEOUT)
         if response.status_code != 200:
             print(f"  ✗ HTTP {response.status_code}")
             return ''
         
-        soup = BeautifulSoup(response.content, 'html.parser')
+        doc = lxml_html.fromstring(response.content)
         
         # Try to get article body
-        article_div = soup.find('div', attrs={'data-testid': 'ArticleBody'})
-        if article_div:
-            text = article_div.get_text(separator=' ', strip=True)
+        article_divs = doc.xpath('//div[@data-testid="ArticleBody"]')
+        if article_divs:
+            article_div = article_divs[0]
+            for node in article_div.xpath('.//script | .//style'):
+                node.drop_tree()
+            text = ' '.join(t.strip() for t in article_div.itertext() if t.strip())
             # Clean up - remove common footer text
-            text = re.sub(r'Reporting by.*$', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'Sign up\s+here\.?', '', text, flags=re.IGNORECASE)
-            text = re.sub(r'Our Standards:.*$', '', text, flags=re.IGNORECASE)
+            for pattern in FOOTER_PATTERNS:
+                text = pattern.sub('', text)
             return text.strip()
         
         # Fallback: use meta description
-        og_desc = soup.find('meta', property='og:description')
+        og_desc = doc.xpath('//meta[@property="og:description"]/@content')
         if og_desc:
-            return og_desc.get('content', '')
+            return og_desc[0]
         
         return ''
     except Exception as e:
@@ -292,10 +323,11 @@ def scrape(existing_links=None):
     print(f"Already scraped from Reuters: {reuters_count} articles")
     
     try:
-        response = requests.get(NEWS_URL, cookies=cookies, headers=headers, timeout=TIMEOUT)
+        response = SESSION.get(NEWS_URL, cookies=cookies, headers=headers, timeout=TIMEOUT, stream=True)
         print(f"Status: {response.status_code}")
         
         if response.status_code == 401:
+            response.close()
             print("\n⚠️  ACCESS DENIED - Cookies may be expired!")
             print("Please update cookies in the script from your browser.")
             return []
@@ -304,10 +336,16 @@ def scrape(existing_links=None):
         print(f"Error fetching main page: {e}")
         return []
     
-    soup = BeautifulSoup(response.content, 'html.parser')
+    try:
+        tree = parse_section_page(response)
+    except Exception as e:
+        print(f"Error parsing main page: {e}")
+        return []
+    finally:
+        response.close()
     
     print("\nChecking articles...")
-    recent_articles = get_article_links(soup)
+    recent_articles = get_article_links(tree)
     
     print(f"\nFound {len(recent_articles)} total articles")
     
@@ -323,7 +361,6 @@ def scrape(existing_links=None):
     results = fetch_articles_parallel(
         articles=new_articles,
         fetch_func=get_article_content,
-        max_workers=10,
         source_name=SOURCE,
         standardize=True
     )
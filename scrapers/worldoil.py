@@ -1,16 +1,19 @@
 """
 World Oil News Scraper
 Scrapes https://www.worldoil.com/news for oil & gas news articles
-Filters for today and yesterday only, summarizes with BART model
+Collects all listed articles (date filtering disabled) and stores the
+cleaned full text - no summarization step
 """
 
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree, html as lxml_html
 from datetime import datetime, timedelta
 import pandas as pd
 import os
 import re
 from scrapers.utils import standardize_date, clean_content, save_to_csv, get_existing_links as get_links, fetch_articles_parallel
+from scrapers.http_client import SESSION, polite_get
 
 # Configuration
 SOURCE = 'worldoil'
@@ -24,6 +27,33 @@ NEWS_URLS = [
 CSV_FILE = os.path.join(os.path.dirname(__file__), 'articles.csv')
 TIMEOUT = 30  # seconds
 
+HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
+# Article URLs look like /news/YYYY/MM/DD/slug/
+NEWS_URL_PATTERN = re.compile(r'/news/(\d{4})/(\d{2})/(\d{2})/([^/]+)')
+
+# Same pattern as an XPath (EXSLT regex) filter, compiled once, so only
+# article anchors come back from the listing page
+NEWS_LINKS_XPATH = etree.XPath(
+    r"//a[re:test(@href, '/news/\d{4}/\d{2}/\d{2}/[^/]+')]",
+    namespaces={'re': 'http://exslt.org/regular-expressions'},
+)
+
+# Article body containers, tried in order
+# World Oil uses article-body or similar classes
+CONTENT_SELECTORS = (
+    'div.article-body',
+    'div.article-content',
+    'div.content-body',
+    'article',
+    'div.entry-content',
+    'div.post-content',
+)
+
 # Date setup
 today = datetime.now().date()
 yesterday = today - timedelta(days=1)
@@ -53,32 +83,16 @@ def is_recent(article_date):
 def fetch_article_content(url):
     """Fetch full article text from article page"""
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-            'Accept-Language': 'en-US,en;q=0.5',
-        }
-        
-        response = requests.get(url, headers=headers, timeout=30)
+        response = SESSION.get(url, headers=HEADERS, timeout=TIMEOUT)
         if response.status_code != 200:
             print(f"    Warning: Article returned status {response.status_code}")
             return None
             
-        soup = BeautifulSoup(response.text, 'html.parser')
+        soup = BeautifulSoup(response.text, 'lxml')
         
         # Try to find the article content
-        # World Oil uses article-body or similar classes
-        content_selectors = [
-            'div.article-body',
-            'div.article-content',
-            'div.content-body',
-            'article',
-            'div.entry-content',
-            'div.post-content',
-        ]
-        
         content = None
-        for selector in content_selectors:
+        for selector in CONTENT_SELECTORS:
             content_div = soup.select_one(selector)
             if content_div:
                 # Get all paragraph text
@@ -96,7 +110,7 @@ def fetch_article_content(url):
                 content = ' '.join(p.get_text(strip=True) for p in paragraphs if p.get_text(strip=True))
         
         if content and len(content) > 50:
-            return content[:5000]  # Limit content length for summarization
+            return content[:5000]  # Limit stored content length
         
         return None
         
@@ -107,7 +121,6 @@ def fetch_article_content(url):
 
 def scrape_news():
     """Main scraping function"""
-    import time
     print("=" * 60)
     print(f"World Oil Scraper - {datetime.now().strftime('%Y-%m-%d %H:%M')}")
     print("=" * 60)
@@ -115,19 +128,14 @@ def scrape_news():
     existing_links = get_existing_links()
     print(f"Already scraped from World Oil: {len(existing_links)} articles")
     
-    headers = {
-        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/131.0.0.0 Safari/537.36',
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-    }
-    
-    all_articles = []
-    seen_urls = set()
+    # Listed articles keyed by URL - first listing of each URL wins
+    articles_by_url = {}
     
     for news_url in NEWS_URLS:
         print(f"\n--- Checking {news_url} ---")
         try:
-            response = requests.get(news_url, headers=headers, timeout=TIMEOUT)
+            # Rate limited per host in http_client.MIN_INTERVAL
+            response = polite_get(news_url, headers=HEADERS, timeout=TIMEOUT)
             print(f"Status: {response.status_code}")
             
             if response.status_code != 200:
@@ -138,16 +146,20 @@ def scrape_news():
             print(f"Request error: {e}")
             continue
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        try:
+            tree = lxml_html.fromstring(response.content)
+        except Exception as e:
+            print(f"Parse error: {e}")
+            continue
         
-        # Find all links that match the news article pattern
-        all_links = soup.find_all('a', href=True)
+        # Only anchors that match the news article pattern
+        all_links = NEWS_LINKS_XPATH(tree)
         
         for link in all_links:
-            href = link.get('href', '')
+            href = link.get('href')
             
             # Match /news/YYYY/MM/DD/slug/ pattern
-            match = re.search(r'/news/(\d{4})/(\d{2})/(\d{2})/([^/]+)', href)
+            match = NEWS_URL_PATTERN.search(href)
             if not match:
                 continue
                 
@@ -158,9 +170,8 @@ def scrape_news():
                 full_url = href
                 
             # Skip duplicates
-            if full_url in seen_urls or full_url in existing_links:
+            if full_url in articles_by_url or full_url in existing_links:
                 continue
-            seen_urls.add(full_url)
             
             # Extract date from URL
             year, month, day = match.groups()[:3]
@@ -170,35 +181,30 @@ def scrape_news():
                 continue
             
             # Get title from link text or parent
-            title = link.get_text(strip=True)
-            if not title or len(title) < 10:
-                # Try to find title in parent or sibling
-                parent = link.find_parent(['div', 'article', 'li'])
-                if parent:
-                    heading = parent.find(['h1', 'h2', 'h3', 'h4'])
-                if heading:
-                    title = heading.get_text(strip=True)
-        
+            title = link.text_content().strip()
+            if len(title) < 10:
+                # Try to find title in parent or sibling - reset per link so
+                # a heading from a previous anchor never leaks into this one
+                heading = None
+                parents = link.xpath('ancestor::*[self::div or self::article or self::li][1]')
+                if parents:
+                    headings = parents[0].xpath('(.//h1 | .//h2 | .//h3 | .//h4)[1]')
+                    heading = headings[0] if headings else None
+                if heading is not None:
+                    title = heading.text_content().strip()
+            
             if not title or len(title) < 10:
                 continue
                 
             # Add all articles
             print(f"  ✓ Found ({article_date.strftime('%B %d, %Y')}): {title[:50]}...")
-            all_articles.append({
+            articles_by_url[full_url] = {
                 'link': full_url,
                 'title': title,
                 'date': article_date.strftime('%Y-%m-%d')
-            })
-        
-        time.sleep(1)  # Be nice to the server
+            }
     
-    # Remove duplicates
-    seen = set()
-    articles_to_scrape = []
-    for article in all_articles:
-        if article['link'] not in seen:
-            seen.add(article['link'])
-            articles_to_scrape.append(article)
+    articles_to_scrape = list(articles_by_url.values())
     
     print(f"\nFound {len(articles_to_scrape)} total articles")
     
@@ -218,7 +224,6 @@ def scrape_news():
     results = fetch_articles_parallel(
         articles=new_articles,
         fetch_func=fetch_article_content,
-        max_workers=10,
         source_name=SOURCE,
         standardize=True
     )
@@ -46,7 +46,7 @@ After=network.target
 User=root
 WorkingDirectory=/root/oilgaschatbot
 Environment="PATH=/root/oilgaschatbot/venv/bin"
-ExecStart=/root/oilgaschatbot/venv/bin/gunicorn -w 2 -b 0.0.0.0:5000 --timeout 120 web.app:app
+ExecStart=/root/oilgaschatbot/venv/bin/gunicorn -w 2 --preload -b 0.0.0.0:5000 --timeout 120 web.app:app
 Restart=always
 RestartSec=5
 
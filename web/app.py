@@ -5,6 +5,8 @@ Clean Google-like interface for searching oil & gas news
 
 from flask import Flask, render_template, request, jsonify
 from flask_cors import CORS
+from datetime import date
+from functools import lru_cache
 import sys
 import os
 
@@ -29,6 +31,66 @@ def get_chatbot():
     return chatbot
 
 
+# Under gunicorn, load models at import time. With --preload that happens once
+# in the master before workers fork, so every worker shares the loaded model
+# and embedding pages copy-on-write instead of loading its own copy. The dev
+# server below keeps loading on the first request. A failed preload must not
+# stop the server booting - it is logged and retried lazily per request.
+if __name__ != '__main__':
+    try:
+        get_chatbot()
+    except Exception as e:
+        print(f"Model preload failed, will retry on first request: {e}")
+        chatbot = None
+
+
+@lru_cache(maxsize=512)
+def _cached_search(query, day):
+    """
+    Classify, search and extract answers for a normalized query.
+    
+    Cached per (query, day): the recency boost depends on today's date, so
+    entries from earlier days are simply never hit again and age out.
+    Callers must not mutate the returned values.
+    """
+    bot = get_chatbot()
+    
+    # Ensure models are loaded
+    if not bot.loaded:
+        bot.load_models()
+    
+    # Encode the query once for both classification and search
+    query_embedding = bot.model.encode([query])[0]
+    
+    classification = bot.classify_query(query, query_embedding=query_embedding)
+    
+    # Search for articles (get more to filter)
+    results = bot.search_articles(query, top_k=10, query_embedding=query_embedding)
+    
+    # Filter by relevance >= 35% (semantic score)
+    relevant_results = [r for r in results if r.get('original_score', 0) >= 0.35]
+    
+    # Answers for the top 2 results: (direct answer, best sentence, key facts)
+    answers = []
+    for result in relevant_results[:2]:
+        content = result['content']
+        direct = bot.get_direct_answer(query, content)
+        if direct:
+            direct = direct.replace('**', '').replace('*', '')
+        answers.append((
+            direct,
+            bot.get_best_sentence(content, query),
+            bot.extract_key_facts(content, query),
+        ))
+    
+    return classification, results, relevant_results, answers
+
+
+def run_search(query):
+    """Cached search - repeated queries skip embedding and answer extraction."""
+    return _cached_search(' '.join(query.split()), date.today().isoformat())
+
+
 @app.route('/')
 def home():
     """Render the main search page"""
@@ -44,17 +106,7 @@ def search():
         return jsonify({'error': 'Please enter a search query'})
     
     try:
-        bot = get_chatbot()
-        
-        # Ensure models are loaded
-        if not bot.loaded:
-            bot.load_models()
-        
-        # Get classification
-        classification = bot.classify_query(query)
-        
-        # Search for articles (get more to filter)
-        results = bot.search_articles(query, top_k=10)
+        classification, results, relevant_results, answers = run_search(query)
         
         # If no results (query required specific terms that weren't found)
         if not results:
@@ -64,12 +116,6 @@ def search():
                 'topic': classification['category'] if classification else None
             })
         
-        # Filter by relevance >= 35% (semantic score)
-        relevant_results = []
-        for r in results:
-            if r.get('original_score', 0) >= 0.35:
-                relevant_results.append(r)
-        
         if not relevant_results:
             return jsonify({
                 'success': False,
@@ -78,24 +124,9 @@ def search():
             })
         
         # Results are already sorted by boosted score (recent articles get 10% boost)
-        # Get top 2 results
-        top_results = relevant_results[:2]
-        # Format results
+        # Format top 2 results
         formatted_results = []
-        for result in top_results:
-            content = result['content']
-            
-            # Get direct answer
-            direct = bot.get_direct_answer(query, content)
-            if direct:
-                direct = direct.replace('**', '').replace('*', '')
-            
-            # Get best sentence
-            best_sent = bot.get_best_sentence(content, query)
-            
-            # Extract key facts (already clean, no emojis)
-            facts = bot.extract_key_facts(content, query)
-            
+        for result, (direct, best_sent, facts) in zip(relevant_results, answers):
             # Check if article has recency boost
             recency_boost = result.get('recency_boost', 0)
             keyword_boost = result.get('keyword_boost', 0)
@@ -170,13 +201,7 @@ def api_search():
         return jsonify({'error': 'Please provide a query parameter'})
     
     try:
-        bot = get_chatbot()
-        
-        if not bot.loaded:
-            bot.load_models()
-        
-        classification = bot.classify_query(query)
-        results = bot.search_articles(query, top_k=10)
+        classification, results, relevant_results, answers = run_search(query)
         
         if not results:
             return jsonify({
@@ -185,9 +210,6 @@ def api_search():
                 'topic': classification['category'] if classification else None
             })
         
-        # Filter by relevance >= 35%
-        relevant_results = [r for r in results if r.get('original_score', 0) >= 0.35]
-        
         if not relevant_results:
             return jsonify({
                 'success': False,
@@ -195,18 +217,10 @@ def api_search():
                 'topic': classification['category'] if classification else None
             })
         
-        top_results = relevant_results[:2]
         formatted_results = []
         
-        for result in top_results:
+        for result, (direct, best_sent, facts) in zip(relevant_results, answers):
             content = result['content']
-            direct = bot.get_direct_answer(query, content)
-            if direct:
-                direct = direct.replace('**', '').replace('*', '')
-            
-            best_sent = bot.get_best_sentence(content, query)
-            facts = bot.extract_key_facts(content, query)
-            
             formatted_results.append({
                 'title': result['title'],
                 'source': result['source'],